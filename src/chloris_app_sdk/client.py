@@ -1,24 +1,144 @@
 """ This is the primary module of the chloris-app-sdk. """
 import os
+import threading
 import uuid
-from time import sleep
-from typing import Any, Mapping, Optional, Sequence, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import sleep, time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 import json
-from datetime import datetime, timedelta, timezone
 
+import botocore.session
+from botocore.compat import HAS_CRT as _HAS_CRT
+from botocore.config import Config
+from botocore.credentials import RefreshableCredentials
 from botocore.exceptions import ClientError
 from urllib3 import PoolManager
+from urllib3.util import Retry, Timeout
 import boto3
-from .utils import is_token_expired
+from .utils import get_token_expiration, json_dumps, json_loads
 import logging
 
-from botocore.config import Config
-
 logger = logging.getLogger("chloris_app_sdk.client")
 
+# consider tokens expired this many seconds before they actually expire (10 minutes)
+_TOKEN_EXPIRATION_TOLERANCE = 10 * 60
+# delays (in seconds) between checks for a normalized boundary
+_BOUNDARY_POLL_INITIAL_DELAY = 1.5
+_BOUNDARY_POLL_MAX_DELAY = 30
+# S3 location of reporting unit data, served over https from the data path
+_S3_DATA_PATH_PREFIX = "s3://chloris-app-data/data/"
+# files uploaded alongside a shapefile's .shp
+_SHAPEFILE_SIDECAR_EXTENSIONS = (".dbf", ".prj", ".shx")
+# S3 client settings: keep connections warm between uploads and polls, and retry throttled or failed requests
+_S3_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    connect_timeout=5,
+    read_timeout=60,
+)
+# verify uploads with CRC32C when the AWS CRT is installed (otherwise zlib's CRC32)
+_UPLOAD_CHECKSUM_ALGORITHM = "CRC32C" if _HAS_CRT else "CRC32"
+
+
+def _coerce_year_fields(entry: dict, fields: Sequence[str] = ("periodChangeStartYear", "periodChangeEndYear")) -> None:
+    """Ensure the given year fields (by default "periodChangeStartYear" and "periodChangeEndYear") are integers, in place."""
+    for field in fields:
+        value = entry.get(field)
+        if type(value) is str:
+            entry[field] = int(value)
+
+
+def _token_refresh_deadline(token: Optional[str]) -> float:
+    """
+    Get the UNIX timestamp at which a token should be refreshed, 10 minutes before it expires.
+
+    Tokens that are missing or can't be decoded are due for a refresh immediately.
+    """
+    exp_timestamp = get_token_expiration(token) if token is not None else None
+    if exp_timestamp is None:
+        return float("-inf")
+    return exp_timestamp - _TOKEN_EXPIRATION_TOLERANCE
+
+
+def _is_analysis_ready(entry: Mapping[str, Any]) -> bool:
+    """Check if a reporting unit's analysis is completed and quality controlled, i.e. its stats and layers are available."""
+    return bool(entry.get("analysisCompletedAt") and entry.get("qualityControlledAt"))
+
+
+def _boundary_upload_files(file: str) -> List[Tuple[str, str]]:
+    """
+    Get the files to upload for a boundary file, with the extension to upload each one under.
+
+    For a shapefile, its sidecar files (.dbf, .prj, .shx) that exist are included, found with a single listing
+    of its directory. Their names are compared case-insensitively (e.g. foo.DBF), as case-insensitive filesystems
+    would, and they are uploaded under the lowercase extension, following the extension of the .shp
+    (e.g. my.site.shp and my.site.dbf are uploaded as {upload_id}.site.shp and {upload_id}.site.dbf).
+
+    Returns: The (path, extension) of each file to upload, with the given file last.
+    """
+    # split the file extensions (.aux.xml)
+    file_ext = ".".join(os.path.basename(file).split(".")[1:])
+    files = []
+    if file.endswith(".shp"):
+        shp_dir = os.path.dirname(file)
+        shp_base = os.path.basename(file)[: -len(".shp")]
+        sidecar_names = {(shp_base + shp_ext).lower(): shp_base + shp_ext for shp_ext in _SHAPEFILE_SIDECAR_EXTENSIONS}
+        sidecars = {}  # type: Dict[str, str]
+        with os.scandir(shp_dir or ".") as entries:
+            for name in sorted(entry.name for entry in entries):
+                sidecar_name = sidecar_names.get(name.lower())
+                # upload a single file per sidecar, preferring the exact name if there are case variants
+                if sidecar_name is not None and (sidecar_name not in sidecars or name == sidecar_name):
+                    sidecars[sidecar_name] = name
+        for sidecar_name in sorted(sidecars):
+            sidecar_ext = file_ext[: -len("shp")] + sidecar_name[len(shp_base) + 1 :]
+            files.append((os.path.join(shp_dir, sidecars[sidecar_name]), sidecar_ext))
+    files.append((file, file_ext))
+    return files
+
+
+def _is_expired_token_error(ex: Optional[BaseException]) -> bool:
+    """Check if an exception, or the boto3 ClientError it was raised from, is an S3 ExpiredToken error."""
+    while ex is not None:
+        if isinstance(ex, ClientError):
+            return ex.response.get("Error", {}).get("Code") == "ExpiredToken"
+        ex = ex.__cause__ or ex.__context__
+    return False
+
+
 class ChlorisAppClient:
     """A client for interacting with the Chloris App API."""
 
+    # shared by all clients that aren't given their own http_pool, so that they reuse the same connections
+    _default_http_pool = None  # type: Optional[PoolManager]
+
+    @classmethod
+    def _get_default_http_pool(cls) -> PoolManager:
+        """
+        Get the urllib3 PoolManager shared by all clients, creating it if needed.
+
+        Only idempotent requests (GET and HEAD) are retried on throttling (429) or gateway errors, with
+        exponential backoff, since POST and PUT requests may submit boundaries or create sites.
+
+        Returns: The shared urllib3 PoolManager.
+        """
+        if cls._default_http_pool is None:
+            cls._default_http_pool = PoolManager(
+                num_pools=16,
+                maxsize=32,
+                block=False,
+                timeout=Timeout(connect=5, read=30),
+                retries=Retry(
+                    total=5,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 502, 503, 504),
+                    allowed_methods=frozenset(["GET", "HEAD"]),
+                    raise_on_status=False,
+                ),
+            )
+        return cls._default_http_pool
+
     def __init__(
         self,
         organization_id: str,
@@ -37,23 +157,28 @@ class ChlorisAppClient:
             access_token: The user access token to use, may also be set via CHLORIS_ACCESS_TOKEN environment variable.
             refresh_token: The user refresh token to use, may also be set via CHLORIS_REFRESH_TOKEN environment variable.
             api_endpoint: The Chloris App API endpoint to use, defaults to https://app.chloris.earth/api/, may also be set via CHLORIS_API_ENDPOINT environment variable.
-            http_pool: The urllib3 PoolManager to use for HTTP requests, if not provided a new one will be created.
+            http_pool: The urllib3 PoolManager to use for HTTP requests, if not provided a PoolManager shared by all clients will be used.
         """
 
         # lazily loaded variables
         self._sts_credentials = None  # type: Optional[Mapping[str, Any]]
+        self._sts_credentials_expire_at = 0.0
         self._cognito_idp_client = None
         self._cognito_identity_client = None
+        self._boto3_session = None  # type: Optional[boto3.Session]
         self._s3_bucket_resource = None
         self._s3_client = None
+        # held while checking and refreshing the tokens, and while creating or resetting the S3 client,
+        # so concurrent requests trigger a single refresh and never see a half-reset client
+        self._token_lock = threading.RLock()
 
         # parameter parsing
         self.organization_id = organization_id
         self.api_endpoint = api_endpoint
-        self.__id_token = id_token
-        self.__access_token = access_token
+        self._set_id_token(id_token)
+        self._set_access_token(access_token)
         self.__refresh_token = refresh_token
-        self._http_pool = http_pool if http_pool is not None else PoolManager()
+        self._http_pool = http_pool if http_pool is not None else self._get_default_http_pool()
         # attempt to get params from environment variables
         if self.organization_id is None:
             self.organization_id = os.environ.get("CHLORIS_ORGANIZATION_ID")
@@ -63,20 +188,24 @@ class ChlorisAppClient:
             self.api_endpoint = "https://app.chloris.earth/api/"
         if not self.api_endpoint.endswith("/"):
             self.api_endpoint += "/"
+        self._url_info = self.api_endpoint + "info"
+        self._url_boundary = self.api_endpoint + "boundary"
+        self._url_reporting_unit = self.api_endpoint + "reportingUnit"
         self.data_path = self.api_endpoint.replace("/api/", "/data/")
+        self._data_path_prefix = self.data_path.rstrip("/") + "/"
         if self.__id_token is None:
-            self.__id_token = os.environ.get("CHLORIS_ID_TOKEN")
+            self._set_id_token(os.environ.get("CHLORIS_ID_TOKEN"))
         if self.__access_token is None:
-            self.__access_token = os.environ.get("CHLORIS_ACCESS_TOKEN")
+            self._set_access_token(os.environ.get("CHLORIS_ACCESS_TOKEN"))
         if self.__refresh_token is None:
             self.__refresh_token = os.environ.get("CHLORIS_REFRESH_TOKEN")
         # Ensure the access token we have is not expired
         if self.__access_token is not None:
-            if is_token_expired(self.__access_token):
-                self.__access_token = None
+            if self._is_access_token_expired():
+                self._set_access_token(None)
         if self.__id_token is not None:
-            if is_token_expired(self.__id_token):
-                self.__id_token = None
+            if self._is_id_token_expired():
+                self._set_id_token(None)
         # Ensure we have at least the id_token or refresh_token
         if self.__id_token is None and self.__refresh_token is None:
             raise ValueError("You must provide either an id_token or refresh_token. See help at: https://app.chloris.earth/docs/")
@@ -85,15 +214,21 @@ class ChlorisAppClient:
 
         # attempt to get access token from refresh token
         if self.__id_token is None:
-            self.__id_token = self._get_id_token()
+            self._get_id_token()
 
     def _get_api_info(self) -> None:
         """Get the environment-specific info for the Chloris API"""
-        response = self._http_pool.request('GET', self.api_endpoint + 'info')
+        response = self._http_pool.request('GET', self._url_info)
         if response.status != 200:
             raise Exception("Failed to retrieve info from Chloris API")
-        response_json = json.loads(response.data.decode('utf-8'))
+        response_json = json_loads(response.data)
         self._aws_resources = response_json
+        # cache the resources used on every request as plain attributes
+        self._bucket = response_json["awsUserFilesS3Bucket"]  # type: str
+        self._region = response_json["awsRegion"]  # type: str
+        self._user_pool_id = response_json["awsUserPoolId"]  # type: str
+        self._identity_pool_id = response_json["awsCognitoIdentityPoolId"]  # type: str
+        self._user_pool_client_id = response_json["awsUserPoolWebClientId"]  # type: str
 
     def _get_id_token(self) -> str:
         """
@@ -101,32 +236,67 @@ class ChlorisAppClient:
 
         Returns: The id token.
         """
-        # check that the id token is not about to expire (10 minutes)
-        if self.__id_token is not None and is_token_expired(self.__id_token):
-            self.__id_token = None
-        # get a new id token using the refresh token if needed
-        if self.__id_token is None:
-            self.refresh_tokens()
-        if self.__id_token is None:
-            raise Exception("Failed to refresh id token for Chloris App")
-        # return the id token
-        return self.__id_token
+        with self._token_lock:
+            # check that the id token is not about to expire (10 minutes)
+            if self.__id_token is not None and self._is_id_token_expired():
+                self._set_id_token(None)
+            # get a new id token using the refresh token if needed
+            if self.__id_token is None:
+                self.refresh_tokens()
+            if self.__id_token is None:
+                raise Exception("Failed to refresh id token for Chloris App")
+            # return the id token
+            return self.__id_token
+
+    def _get_auth_headers(self) -> Mapping[str, str]:
+        """
+        Get the headers for authenticated API requests, refreshing the id token if needed.
+
+        Returns: A new copy of the request headers for each request, since urllib3 (before 2.0) removes the
+            Authorization header from the dict it is given when following a redirect to another host.
+        """
+        with self._token_lock:
+            self._get_id_token()
+            return dict(self._auth_headers)
 
     def _get_access_token(self) -> str:
         """Get the access token, refreshing it if needed.
 
         Returns: The access token.
         """
-        # check that the access token is not about to expire (10 minutes)
-        if self.__access_token is not None and is_token_expired(self.__access_token):
-            self.__access_token = None
-        # get a new access token using the refresh token if needed
-        if self.__access_token is None:
-            self.refresh_tokens()
-        if self.__access_token is None:
-            raise Exception("Failed to refresh access token for Chloris App")
-        # return the access token
-        return self.__access_token
+        with self._token_lock:
+            # check that the access token is not about to expire (10 minutes)
+            if self.__access_token is not None and self._is_access_token_expired():
+                self._set_access_token(None)
+            # get a new access token using the refresh token if needed
+            if self.__access_token is None:
+                self.refresh_tokens()
+            if self.__access_token is None:
+                raise Exception("Failed to refresh access token for Chloris App")
+            # return the access token
+            return self.__access_token
+
+    def _set_id_token(self, id_token: Optional[str]) -> None:
+        """Set the id token, caching its expiration and request headers so they're only copied for each request."""
+        self.__id_token = id_token
+        # assigned in one step, since other threads may be reading the headers
+        self._auth_headers = (
+            {"Content-Type": "application/json", "Authorization": f"Bearer {id_token}"} if id_token is not None else None
+        )  # type: Optional[Mapping[str, str]]
+        self.__id_token_refresh_at = _token_refresh_deadline(id_token)
+
+    def _set_access_token(self, access_token: Optional[str]) -> None:
+        """Set the access token, caching its expiration so it isn't decoded on every request."""
+        self.__access_token = access_token
+        self.__access_token_refresh_at = _token_refresh_deadline(access_token)
+
+    def _is_id_token_expired(self) -> bool:
+        """Check if the id token is expired or about to expire (10 minutes)."""
+        return time() >= self.__id_token_refresh_at
+
+    def _is_access_token_expired(self) -> bool:
+        """Check if the access token is expired or about to expire (10 minutes)."""
+        return time() >= self.__access_token_refresh_at
 
     def refresh_tokens(self) -> None:
         """Refresh the id and access tokens using the refresh token."""
@@ -136,10 +306,10 @@ class ChlorisAppClient:
             response = self._get_cognito_idp_client().initiate_auth(
                 AuthFlow="REFRESH_TOKEN",
                 AuthParameters={"REFRESH_TOKEN": self.__refresh_token},
-                ClientId=self._aws_resources["awsUserPoolWebClientId"],
+                ClientId=self._user_pool_client_id,
             )
-            self.__access_token = response["AuthenticationResult"]["AccessToken"]
-            self.__id_token = response["AuthenticationResult"]["IdToken"]
+            self._set_access_token(response["AuthenticationResult"]["AccessToken"])
+            self._set_id_token(response["AuthenticationResult"]["IdToken"])
         except Exception as ex:
             raise Exception("Failed to refresh tokens for Chloris App") from ex
 
@@ -150,28 +320,63 @@ class ChlorisAppClient:
         Returns: The boto3 cognito idp client.
         """
         if self._cognito_idp_client is None:
-            self._cognito_idp_client = boto3.client("cognito-idp", config=Config(region_name=self._aws_resources["awsRegion"]))
+            self._cognito_idp_client = boto3.client("cognito-idp", config=Config(region_name=self._region))
         return self._cognito_idp_client
 
+    def _get_boto3_session(self) -> boto3.Session:
+        """
+        Get the boto3 session for the user's STS temporary credentials, creating it if needed.
+
+        The credentials refresh themselves before they expire, so clients created from this session
+        (and their connection pools) can be reused for the lifetime of this client.
+
+        Returns: The boto3 session.
+        """
+        if self._boto3_session is None:
+            botocore_session = botocore.session.get_session()
+            botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+                metadata=self._get_sts_credentials_metadata(),
+                refresh_using=self._refresh_sts_credentials_metadata,
+                method="cognito-identity",
+            )
+            self._boto3_session = boto3.Session(botocore_session=botocore_session, region_name=self._region)
+        return self._boto3_session
+
+    def _get_sts_credentials_metadata(self) -> Mapping[str, str]:
+        """
+        Get the STS temporary credentials in the format expected by botocore's RefreshableCredentials.
+
+        Returns: The credentials metadata.
+        """
+        credentials = self._get_sts_temporary_credentials()
+        return {
+            "access_key": credentials["AccessKeyId"],
+            "secret_key": credentials["SecretKey"],
+            "token": credentials["SessionToken"],
+            "expiry_time": credentials["Expiration"].isoformat(),
+        }
+
+    def _refresh_sts_credentials_metadata(self) -> Mapping[str, str]:
+        """
+        Get new STS temporary credentials, called by botocore when the current ones are about to expire.
+
+        Returns: The new credentials metadata.
+        """
+        self._sts_credentials = None
+        return self._get_sts_credentials_metadata()
+
     def _get_s3_client(self) -> Any:
         """
         Get the boto3 s3 client, creating it if needed.
 
         Returns: The boto3 s3 client.
         """
-        # check if the credentials are expired
-        if self._sts_credentials_expired():
-            self._s3_client = None
-        # get new client if needed
-        if self._s3_client is None:
-            credentials = self._get_sts_temporary_credentials()
-            self._s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=credentials["AccessKeyId"],
-                aws_secret_access_key=credentials["SecretKey"],
-                aws_session_token=credentials["SessionToken"],
-                config=Config(region_name=self._aws_resources["awsRegion"], ))
-        return self._s3_client
+        with self._token_lock:
+            if self._s3_client is None:
+                self._s3_client = self._get_boto3_session().client(
+                    "s3", config=_S3_CONFIG.merge(Config(region_name=self._region))
+                )
+            return self._s3_client
 
     def _get_s3_bucket_resource(self) -> Any:
         """
@@ -179,22 +384,13 @@ class ChlorisAppClient:
 
         Returns: The boto3 s3 bucket resource.
         """
-
-        # check if the credentials are expired
-        if self._sts_credentials_expired():
-            self._s3_bucket_resource = None
-        # get new resource if needed
-        if self._s3_bucket_resource is None:
-            credentials = self._get_sts_temporary_credentials()
-            s3_resource = boto3.resource(
-                "s3",
-                region_name=self._aws_resources["awsRegion"],
-                aws_access_key_id=credentials["AccessKeyId"],
-                aws_secret_access_key=credentials["SecretKey"],
-                aws_session_token=credentials["SessionToken"],
-            )
-            self._s3_bucket_resource = s3_resource.Bucket(self._aws_resources["awsUserFilesS3Bucket"])
-        return self._s3_bucket_resource
+        with self._token_lock:
+            if self._s3_bucket_resource is None:
+                s3_resource = self._get_boto3_session().resource(
+                    "s3", config=_S3_CONFIG.merge(Config(region_name=self._region))
+                )
+                self._s3_bucket_resource = s3_resource.Bucket(self._bucket)
+            return self._s3_bucket_resource
 
     def _get_sts_temporary_credentials(self) -> Mapping[str, Any]:
         """
@@ -204,7 +400,7 @@ class ChlorisAppClient:
 
         """
         if self._cognito_identity_client is None:
-            self._cognito_identity_client = boto3.client("cognito-identity", config=Config(region_name=self._aws_resources["awsRegion"]))
+            self._cognito_identity_client = boto3.client("cognito-identity", config=Config(region_name=self._region))
         # check if the credentials are expired
         if self._sts_credentials_expired():
             self._sts_credentials = None
@@ -212,15 +408,17 @@ class ChlorisAppClient:
         if self._sts_credentials is None:
             for i in range(12):
                 try:
-                    logins = {f"""cognito-idp.{self._aws_resources['awsRegion']}.amazonaws.com/{self._aws_resources['awsUserPoolId']}""": self._get_id_token()}
+                    logins = {f"""cognito-idp.{self._region}.amazonaws.com/{self._user_pool_id}""": self._get_id_token()}
                     # Get the identity ID associated with the Cognito access token.
-                    response = self._cognito_identity_client.get_id(IdentityPoolId=self._aws_resources["awsCognitoIdentityPoolId"], Logins=logins)
+                    response = self._cognito_identity_client.get_id(IdentityPoolId=self._identity_pool_id, Logins=logins)
                     identity_id = response["IdentityId"]
                     # Get temporary STS credentials for the identity ID.
                     response = self._cognito_identity_client.get_credentials_for_identity(IdentityId=identity_id, Logins=logins)
                     # Extract the temporary credentials.
                     self._sts_credentials = response["Credentials"]
                     self._sts_credentials["IdentityId"] = identity_id
+                    # consider the credentials expired 10 minutes before they actually expire
+                    self._sts_credentials_expire_at = self._sts_credentials["Expiration"].timestamp() - 10 * 60
                     break
                 except Exception as ex:
                     # Handle rate limiting by backing off,
@@ -259,42 +457,65 @@ class ChlorisAppClient:
         """
         if metadata is None:
             metadata = {}
+        if not body and not file_path:
+            raise ValueError("Either body or file_path must be provided")
+        s3_client = self._get_s3_client()
         try:
-            if body:
-                self._get_s3_bucket_resource().put_object(Body=body, Key=key, Metadata=metadata)
-            elif file_path:
-                self._get_s3_bucket_resource().upload_file(file_path, key, ExtraArgs={"Metadata": metadata})
-            else:
-                raise ValueError("Either body or file_path must be provided")
-        except Exception as ex: # retry once for expired token during long upload
-            if "ExpiredToken" in str(ex):
-                if body:
-                    self._get_s3_bucket_resource().put_object(Body=body, Key=key, Metadata=metadata)
-                elif file_path:
-                    self._get_s3_bucket_resource().upload_file(file_path, key, ExtraArgs={"Metadata": metadata})
-                else:
-                    raise ValueError("Either body or file_path must be provided")
-
+            self._upload_file_once(s3_client, key, body, file_path, metadata)
+        except Exception as ex:
+            # retry once for expired token during long upload, with new credentials
+            if not _is_expired_token_error(ex):
+                raise
+            with self._token_lock:
+                # reset the credentials and clients, unless a concurrent upload already has
+                if self._s3_client is s3_client:
+                    self._sts_credentials = None
+                    self._boto3_session = None
+                    self._s3_client = None
+                    self._s3_bucket_resource = None
+                s3_client = self._get_s3_client()
+            self._upload_file_once(s3_client, key, body, file_path, metadata)
+
+    def _upload_file_once(
+        self,
+        s3_client: Any,
+        key: str,
+        body: Optional[str],
+        file_path: Optional[Union[str, os.PathLike]],
+        metadata: Mapping[str, Any],
+    ) -> None:
+        """Upload a file to the user data bucket, without retrying, see `_upload_file()`."""
+        if body:
+            s3_client.put_object(Bucket=self._bucket, Body=body, Key=key, Metadata=metadata)
+        else:
+            s3_client.upload_file(
+                file_path,
+                self._bucket,
+                key,
+                ExtraArgs={"Metadata": metadata, "ChecksumAlgorithm": _UPLOAD_CHECKSUM_ALGORITHM},
+            )
 
-    def download_geojson_boundary(self, path):
+    def download_geojson_boundary(self, path: str, as_bytes: bool = False) -> Union[str, bytes]:
         """
         Download a GeoJSON boundary from the user data bucket
 
         Args:
             path: The path to the file in the protected user space
+            as_bytes: If True, return the raw bytes without decoding them, e.g. to pass directly to a JSON parser.
 
         Returns:
-            The GeoJSON content as a string
+            The GeoJSON content as a string (or bytes if `as_bytes` is True)
         """
-        return self._get_s3_bucket_resource().Object(path).get()["Body"].read().decode("utf-8")
+        content = self._get_s3_bucket_resource().Object(path).get()["Body"].read()
+        return content if as_bytes else content.decode("utf-8")
 
     def _get_object_metadata(self, key: str) -> Optional[Mapping[str, str]]:
         # type hint for the boto3 S3 object
-        obj = self._get_s3_client().head_object(Bucket=self._aws_resources["awsUserFilesS3Bucket"], Key=key)
+        obj = self._get_s3_client().head_object(Bucket=self._bucket, Key=key)
         return obj.get("Metadata")
 
-    def _sts_credentials_expired(self):
-        return self._sts_credentials is not None and datetime.now(timezone.utc) > self._sts_credentials.get("Expiration", 0) - timedelta(minutes=10)
+    def _sts_credentials_expired(self) -> bool:
+        return self._sts_credentials is not None and time() > self._sts_credentials_expire_at
 
     def _upload_boundary_remote_geojson(self, geojson_path: Union[str, os.PathLike], exclude_geometry_path: str = None) -> str:
         """
@@ -322,12 +543,9 @@ class ChlorisAppClient:
         # Use `POST /api/boundary` endpoint to submit the boundary for normalization.
         response = self._http_pool.request(
             "POST",
-            self.api_endpoint + "boundary",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer " + self._get_id_token(),
-            },
-            body=json.dumps(
+            self._url_boundary,
+            headers=self._get_auth_headers(),
+            body=json_dumps(
                 {
                     "organizationId": self.organization_id,
                     "uploadId": upload_id,
@@ -378,20 +596,11 @@ class ChlorisAppClient:
 
         if not isinstance(file, str):
             file = str(file)
-        if file.endswith(".shp"):
-            files = []
-            # if the file is a shapefile, upload all the files in the shapefile
-            for shp_ext in [".dbf", ".prj", ".shx"]:
-                if os.path.exists(file.replace(".shp", shp_ext)):
-                    files.append(file.replace(".shp", shp_ext))
-            files.append(file)
-        else:
-            files = [file]
-
-        # ensure that all the files exist
-        for file in files:
-            if not os.path.exists(file):
-                raise ValueError(f"File does not exist: {file}")
+        # ensure that the file exists
+        if not os.path.exists(file):
+            raise ValueError(f"File does not exist: {file}")
+        # if the file is a shapefile, upload all the files in the shapefile
+        files = _boundary_upload_files(file)
 
         upload_id = str(uuid.uuid4())  # generate random id for this upload
         identity_id = self._get_sts_temporary_credentials()['IdentityId']
@@ -399,28 +608,30 @@ class ChlorisAppClient:
         # metadata just for traceability
         metadata = {"upload-id": upload_id, "organization-id": self.organization_id}
 
-        upload_key = None
-        for file in files:
-            # split the file extensions (.aux.xml)
-            file_ext = ".".join(os.path.basename(file).split(".")[1:])
-            upload_key = f"private/{identity_id}/apiUploads/{upload_id}.{file_ext}"
+        upload_keys = [f"private/{identity_id}/apiUploads/{upload_id}.{file_ext}" for _, file_ext in files]
+        # the primary file is last, its key is submitted for normalization
+        upload_key = upload_keys[-1]
 
-            # upload the file
-            self._upload_file(upload_key, file_path=file, metadata=metadata)
+        # upload the files concurrently, sharing the (thread-safe) S3 client and its connection pool
+        self._get_s3_client()
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            uploads = [
+                executor.submit(self._upload_file, key, file_path=file_path, metadata=metadata)
+                for key, (file_path, _) in zip(upload_keys, files)
+            ]
+            for upload in uploads:
+                upload.result()
 
         # Initiate the normalization process
         response = self._http_pool.request(
             "POST",
-            self.api_endpoint + "boundary",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer " + self._get_id_token(),
-            },
-            body=json.dumps(
+            self._url_boundary,
+            headers=self._get_auth_headers(),
+            body=json_dumps(
                 {
                     "organizationId": self.organization_id,
                     "uploadId": upload_id,
-                    "uploadPath": f"s3://{self._aws_resources['awsUserFilesS3Bucket']}/{upload_key}",
+                    "uploadPath": f"s3://{self._bucket}/{upload_key}",
                     "excludeGeometryPath": exclude_geometry_path,
                 }
             ),
@@ -437,14 +648,19 @@ class ChlorisAppClient:
     def _wait_for_boundary_normalization(self, upload_id: str) -> Optional[str]:
         identity_id = self._get_sts_temporary_credentials()["IdentityId"]
         boundary_key = f"protected/{identity_id}/uploads/{upload_id}.geojson"
-        # Poll S3 with exponential backoff up to 15 minutes for the boundary to be normalized
-        i = 0
+        boundary_path = f"s3://{self._bucket}/{boundary_key}"
+        # the client's credentials refresh themselves, so it can be reused for the whole wait
+        s3_client = self._get_s3_client()
+        bucket = self._bucket
+        # Poll S3 with exponential backoff up to 15 minutes for the boundary to be normalized,
+        # probing often at first (small boundaries normalize quickly) and capping the delay between probes
+        delay = _BOUNDARY_POLL_INITIAL_DELAY
         time_remaining = 15 * 60  # 15 minutes
         while True:
             # check if the boundary has been normalized
             metadata = None
             try:
-                metadata = self._get_object_metadata(boundary_key)
+                metadata = s3_client.head_object(Bucket=bucket, Key=boundary_key).get("Metadata")
             except ClientError as ex:
                 # ignore 404 and 403 errors, as they are expected until the boundary is normalized, re-raise any other errors
                 if ex.response["Error"]["Code"] not in ["404", "403"]:
@@ -454,18 +670,21 @@ class ChlorisAppClient:
                 if metadata.get("error"):
                     raise ValueError(metadata["error"])
                 # upload was successful
-                return f"s3://{self._aws_resources['awsUserFilesS3Bucket']}/{boundary_key}"
+                return boundary_path
             else:
-                delay = 5 * (1.3 ** i)  # exponential backoff
                 time_remaining -= delay
                 if time_remaining <= 0:
                     break
                 sleep(delay)
+                delay = min(delay * 1.3, _BOUNDARY_POLL_MAX_DELAY)  # exponential backoff
 
     def put_reporting_unit(self, reporting_unit_entry: Mapping[str, Any]) -> Mapping[str, Any]:
         """
         Create or update a reporting unit in the Chloris App.
 
+        This request is not retried automatically: if it fails with a timeout or gateway error the site may
+        still have been created, so check `list_active_sites()` before submitting it again.
+
         Args:
             reporting_unit_entry: The reporting unit entry to create or update.
 
@@ -479,17 +698,14 @@ class ChlorisAppClient:
         reporting_unit_entry.pop("layersConfig", None)
         response = self._http_pool.request(
             "PUT",
-            self.api_endpoint + f"reportingUnit",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer " + self._get_id_token(),
-            },
-            body=json.dumps(reporting_unit_entry),
+            self._url_reporting_unit,
+            headers=self._get_auth_headers(),
+            body=json_dumps(reporting_unit_entry),
         )
         if response.status != 200:
             raise Exception(f"Failed to create or update reporting unit: {response.status} {response.data.decode('utf-8')}")
         # return the reporting unit entry
-        return json.loads(response.data.decode("utf-8"))
+        return json_loads(response.data)
 
     def list_active_sites(self) -> Sequence[Mapping[str, Any]]:
         """
@@ -498,37 +714,42 @@ class ChlorisAppClient:
         Returns:
             A list of reporting unit entries.
         """
-        # use POST /api/reportingUnit and nextToken to load all the sites
+        # use POST /api/reportingUnit and nextToken to load all the sites, requesting the
+        # next page in the background while the current page is being filtered
         sites = []
-        next_token = None
-        while True:
-            response = self._http_pool.request(
-                "POST",
-                self.api_endpoint + f"reportingUnit",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": "Bearer " + self._get_id_token(),
-                },
-                body=json.dumps({"organizationId": self.organization_id, "nextToken": next_token}),
-            )
-            if response.status != 200:
-                raise Exception(f"Failed to list reporting units: {response.status} {response.data.decode('utf-8')}")
-            response_json = json.loads(response.data.decode("utf-8"))
-            for reporting_unit in response_json.get("reportingUnits", []):
-                if reporting_unit.get("deletedAt") is None and reporting_unit.get("branchId") is None:
-                    # Ensure "periodChangeStartYear" and "periodChangeEndYear" are integers
-                    if isinstance(reporting_unit.get("periodChangeStartYear"), str):
-                        reporting_unit["periodChangeStartYear"] = int(reporting_unit["periodChangeStartYear"])
-                    if isinstance(reporting_unit.get("periodChangeEndYear"), str):
-                        reporting_unit["periodChangeEndYear"] = int(reporting_unit["periodChangeEndYear"])
-
-                    sites.append(reporting_unit)
-            next_token = response_json.get("nextToken")
-            if next_token is None:
-                break
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(self._list_reporting_units_page, None)
+            while next_page is not None:
+                response_json = next_page.result()
+                next_token = response_json.get("nextToken")
+                next_page = executor.submit(self._list_reporting_units_page, next_token) if next_token is not None else None
+                for reporting_unit in response_json.get("reportingUnits", []):
+                    if reporting_unit.get("deletedAt") is None and reporting_unit.get("branchId") is None:
+                        _coerce_year_fields(reporting_unit)
+                        sites.append(reporting_unit)
 
         return sites
 
+    def _list_reporting_units_page(self, next_token: Optional[str]) -> Mapping[str, Any]:
+        """
+        Get a single page of reporting units for the organization.
+
+        Args:
+            next_token: The token of the page to get, or None for the first page.
+
+        Returns:
+            The response, with the page's "reportingUnits" and the "nextToken" of the following page (if any).
+        """
+        response = self._http_pool.request(
+            "POST",
+            self._url_reporting_unit,
+            headers=self._get_auth_headers(),
+            body=json_dumps({"organizationId": self.organization_id, "nextToken": next_token}),
+        )
+        if response.status != 200:
+            raise Exception(f"Failed to list reporting units: {response.status} {response.data.decode('utf-8')}")
+        return json_loads(response.data)
+
     def get_reporting_unit(self, reporting_unit_id: str, include_stats=False, include_layers_config=False, include_downloads=False) -> Mapping[str, Any]:
         """
         Get a site with its control (if it has one). Optionally also retrieving all stats, layers config, and downloads index.
@@ -564,47 +785,18 @@ class ChlorisAppClient:
         """
         response = self._http_pool.request(
             "POST",
-            self.api_endpoint + f"reportingUnit",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer " + self._get_id_token(),
-            },
-            body=json.dumps({"organizationId": self.organization_id, "reportingUnitId": reporting_unit_id}),
+            self._url_reporting_unit,
+            headers=self._get_auth_headers(),
+            body=json_dumps({"organizationId": self.organization_id, "reportingUnitId": reporting_unit_id}),
         )
         if response.status != 200:
             raise Exception(f"Failed to get reporting unit: {response.status} {response.data.decode('utf-8')}")
-        response_json = json.loads(response.data.decode("utf-8"))
+        response_json = json_loads(response.data)
 
-        reporting_units = []
         for reporting_unit in response_json:
-            # Ensure "periodChangeStartYear" and "periodChangeEndYear" are integers
-            if isinstance(reporting_unit.get("periodChangeStartYear"), str):
-                reporting_unit["periodChangeStartYear"] = int(reporting_unit["periodChangeStartYear"])
-            if isinstance(reporting_unit.get("periodChangeEndYear"), str):
-                reporting_unit["periodChangeEndYear"] = int(reporting_unit["periodChangeEndYear"])
-            # retrieve optional data
-            if include_stats:
-                try:
-                    stats = self.get_reporting_unit_stats(reporting_unit)
-                    # merge stats into reporting unit (except for areaKm2, due to naming conflict)
-                    reporting_unit = {**reporting_unit, **stats}
-                except Exception:
-                    # ignore errors getting stats
-                    pass
-            if include_layers_config:
-                try:
-                    reporting_unit["layersConfig"] = self.get_reporting_unit_layers_config(reporting_unit)
-                except Exception:
-                    # ignore errors getting layers config
-                    pass
-            if include_downloads:
-                try:
-                    reporting_unit["downloads"] = self.get_reporting_unit_downloads(reporting_unit)
-                except Exception:
-                    # ignore errors getting downloads
-                    pass
-
-            reporting_units.append(reporting_unit)
+            _coerce_year_fields(reporting_unit)
+        # retrieve optional data
+        reporting_units = self._fetch_reporting_unit_data(response_json, include_stats, include_layers_config, include_downloads)
 
         # link up the control site
         reporting_unit = reporting_units[0]
@@ -613,6 +805,102 @@ class ChlorisAppClient:
 
         return reporting_unit
 
+    def get_reporting_units_bulk(
+        self,
+        reporting_unit_entries: Sequence[Mapping[str, Any]],
+        include_stats: bool = False,
+        include_layers_config: bool = True,
+        include_downloads: bool = True,
+        max_workers: int = 16,
+    ) -> Mapping[str, Mapping[str, Any]]:
+        """
+        Retrieve the stats, layers config, and/or downloads index for many sites at once, e.g. the result of `list_active_sites()`.
+
+        The requests are made concurrently, errors retrieving any of them are ignored.
+
+        Args:
+            reporting_unit_entries: The site entries.
+            include_stats: If True, also retrieve the stats for each site.
+            include_layers_config: If True, also retrieve the layers config for each site.
+            include_downloads: If True, also retrieve the downloads index for each site.
+            max_workers: The maximum number of requests to make at once.
+
+        Returns:
+            The site entries with the retrieved data, keyed by "reportingUnitId".
+        """
+        reporting_units = self._fetch_reporting_unit_data(
+            reporting_unit_entries, include_stats, include_layers_config, include_downloads, max_workers=max_workers
+        )
+        return {reporting_unit["reportingUnitId"]: reporting_unit for reporting_unit in reporting_units}
+
+    def _fetch_reporting_unit_data(
+        self,
+        reporting_units: Sequence[Mapping[str, Any]],
+        include_stats: bool = False,
+        include_layers_config: bool = False,
+        include_downloads: bool = False,
+        max_workers: int = 6,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the optional stats, layers config, and downloads index for reporting units, concurrently.
+
+        Errors retrieving any of them are ignored, leaving that data out of the entry.
+
+        Args:
+            reporting_units: The reporting unit entries.
+            include_stats: If True, merge the stats into each entry.
+            include_layers_config: If True, add the "layersConfig" to each entry.
+            include_downloads: If True, add the "downloads" index to each entry.
+            max_workers: The maximum number of requests to make at once.
+
+        Returns:
+            Copies of the reporting unit entries, in the same order, with the retrieved data.
+        """
+        fetchers = []
+        if include_stats:
+            fetchers.append(("stats", self.get_reporting_unit_stats))
+        if include_layers_config:
+            fetchers.append(("layersConfig", self.get_reporting_unit_layers_config))
+        if include_downloads:
+            fetchers.append(("downloads", self.get_reporting_unit_downloads))
+        if not fetchers or not reporting_units:
+            return [dict(reporting_unit) for reporting_unit in reporting_units]
+
+        results = [{} for _ in reporting_units]  # type: list
+        tasks: List[Tuple[int, str, Callable[[Mapping[str, Any]], Any]]] = []
+        for i, reporting_unit in enumerate(reporting_units):
+            if not _is_analysis_ready(reporting_unit):
+                # no data is available until the analysis is completed, don't request it
+                if include_downloads:
+                    results[i]["downloads"] = None
+                continue
+            tasks.extend((i, kind, fetch) for kind, fetch in fetchers)
+
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+                futures = {executor.submit(fetch, reporting_units[i]): (i, kind) for i, kind, fetch in tasks}
+                for future in as_completed(futures):
+                    i, kind = futures[future]
+                    try:
+                        results[i][kind] = future.result()
+                    except Exception:
+                        # ignore errors getting optional data
+                        pass
+
+        merged = []  # type: List[Dict[str, Any]]
+        for reporting_unit, data in zip(reporting_units, results):
+            # copy the entry, so the caller's entries (e.g. from list_active_sites) aren't modified
+            reporting_unit = dict(reporting_unit)
+            if "stats" in data:
+                # merge stats into reporting unit (except for areaKm2, due to naming conflict)
+                reporting_unit.update(data["stats"])
+            if "layersConfig" in data:
+                reporting_unit["layersConfig"] = data["layersConfig"]
+            if "downloads" in data:
+                reporting_unit["downloads"] = data["downloads"]
+            merged.append(reporting_unit)
+        return merged
+
     def get_reporting_unit_stats(self, reporting_unit_entry: Mapping[str, Any]) -> Mapping[str, Any]:
         """
         Get the stats for a site.
@@ -623,26 +911,19 @@ class ChlorisAppClient:
         Returns:
             The site stats.
         """
-        if not (reporting_unit_entry.get("analysisCompletedAt") and reporting_unit_entry.get("qualityControlledAt")):
+        if not _is_analysis_ready(reporting_unit_entry):
             raise ValueError("Analysis not completed")
 
         data_path = self._get_data_path(reporting_unit_entry)
         response = self._http_pool.request(
             "GET",
             data_path + "stats.json",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer " + self._get_id_token(),
-            },
+            headers=self._get_auth_headers(),
         )
         if response.status != 200:
             raise Exception(f"Failed to get reporting unit stats: {response.status} {response.data.decode('utf-8')}")
-        result = json.loads(response.data.decode("utf-8"))
-        # Ensure "periodChangeStartYear" and "periodChangeEndYear" are integers
-        if isinstance(result.get("periodChangeStartYear"), str):
-            result["periodChangeStartYear"] = int(result["periodChangeStartYear"])
-        if isinstance(result.get("periodChangeEndYear"), str):
-            result["periodChangeEndYear"] = int(result["periodChangeEndYear"])
+        result = json_loads(response.data)
+        _coerce_year_fields(result)
         # remove areaKm2 due to naming conflict with the reporting unit vector area
         result.pop("areaKm2", None)
         return result
@@ -654,11 +935,11 @@ class ChlorisAppClient:
             version_id = reporting_unit_entry.get("versionId")
             if version_id:
                 versioned_reporting_unit_id = f"{versioned_reporting_unit_id}_{version_id}"
-            data_path = '/'.join([self.data_path.rstrip('/'), reporting_unit_entry['organizationId'], versioned_reporting_unit_id, ''])
+            data_path = f"{self._data_path_prefix}{reporting_unit_entry['organizationId']}/{versioned_reporting_unit_id}/"
         else:
             data_path = data_path.rstrip("/") + "/"
-        if data_path.startswith("s3://"):
-            data_path = data_path.replace("s3://chloris-app-data/data/", self.data_path)
+        if data_path.startswith(_S3_DATA_PATH_PREFIX):
+            data_path = self._data_path_prefix + data_path[len(_S3_DATA_PATH_PREFIX):]
         return data_path
 
     def get_reporting_unit_layers_config(self, reporting_unit_entry: Mapping[str, Any]) -> Mapping[str, Any]:
@@ -671,21 +952,23 @@ class ChlorisAppClient:
         Returns:
             The site layers config.
         """
-        if not (reporting_unit_entry.get("analysisCompletedAt") and reporting_unit_entry.get("qualityControlledAt")):
+        if not _is_analysis_ready(reporting_unit_entry):
             raise ValueError("Analysis not completed")
 
         data_path = self._get_data_path(reporting_unit_entry)
         response = self._http_pool.request(
             "GET",
             data_path + "layers.json",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer " + self._get_id_token(),
-            },
+            headers=self._get_auth_headers(),
+            preload_content=False,
         )
+        try:
+            content = response.read()
+        finally:
+            response.release_conn()
         if response.status != 200:
-            raise Exception(f"Failed to get reporting unit layers config: {response.status} {response.data.decode('utf-8')}")
-        return json.loads(response.data.decode("utf-8"))
+            raise Exception(f"Failed to get reporting unit layers config: {response.status} {content.decode('utf-8')}")
+        return json_loads(content)
 
     def get_reporting_unit_downloads(self, reporting_unit_entry: Mapping[str, Any]) -> Optional[Mapping[str, Any]]:
         """
@@ -697,10 +980,7 @@ class ChlorisAppClient:
         Returns:
             The site downloads index or None if not available.
         """
-        if not (
-            reporting_unit_entry.get("analysisCompletedAt")
-            and reporting_unit_entry.get("qualityControlledAt")
-        ):
+        if not _is_analysis_ready(reporting_unit_entry):
             # downloads not available, return early
             return None
 
@@ -709,16 +989,20 @@ class ChlorisAppClient:
         response = self._http_pool.request(
             "GET",
             data_path + "downloads.json",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer " + self._get_id_token(),
-            },
+            headers=self._get_auth_headers(),
+            preload_content=False,
         )
-        # parse the response, otherwise return None when downloads are not available
-        if response.status != 200:
-            return None
         try:
-            return json.loads(response.data.decode("utf-8"))
+            # parse the response, otherwise return None when downloads are not available
+            if response.status != 200:
+                # discard the error body without buffering it
+                response.drain_conn()
+                return None
+            content = response.read()
+        finally:
+            response.release_conn()
+        try:
+            return json_loads(content)
         except json.JSONDecodeError:
             return None
 
@@ -758,24 +1042,29 @@ class ChlorisAppClient:
         _boundary_path = None
         _control_boundary_path = None
 
+        # lowercase the paths once for the scheme and extension checks below
+        boundary_path_lower = boundary_path.lower()
+        control_boundary_path_lower = control_boundary_path.lower() if control_boundary_path is not None else None
+
         if (
-            boundary_path.startswith("http://") or
-            (control_boundary_path is not None and control_boundary_path.startswith("http://"))
+            boundary_path_lower.startswith("http://") or
+            (control_boundary_path_lower is not None and control_boundary_path_lower.startswith("http://"))
         ):
             raise ValueError("http urls not allowed when uploading from a remote server, please use https")
 
-        if boundary_path.lower().startswith("https://"):
+        boundary_is_remote = boundary_path_lower.startswith("https://")
+        if boundary_is_remote:
             _boundary_path = self._upload_boundary_remote_geojson(boundary_path)
         else:
             _boundary_path = self._upload_boundary_file(boundary_path)
         if control_boundary_path is not None:
-            if control_boundary_path.lower().startswith("https://"):
-                if control_boundary_path.lower().endswith(".geojson") or control_boundary_path.lower().endswith(".json"):
+            if control_boundary_path_lower.startswith("https://"):
+                if control_boundary_path_lower.endswith((".geojson", ".json")):
                     _control_boundary_path = control_boundary_path
                 else:
                     raise ValueError("Only geojson files are supported when submitting sites from a remote url")
             else:
-                if boundary_path.lower().startswith("https://"):
+                if boundary_is_remote:
                     _control_boundary_path = self._upload_boundary_remote_geojson(control_boundary_path, exclude_geometry_path=_boundary_path)
                 else:
                     _control_boundary_path = self._upload_boundary_file(control_boundary_path, exclude_geometry_path=_boundary_path)
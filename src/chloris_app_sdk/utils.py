@@ -1,8 +1,23 @@
 """ General utility functions. """
 import base64
-import json
-from datetime import datetime, timedelta, timezone
-from typing import Any, Mapping, Optional
+import time
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional, Union
+
+# use orjson when it is installed (pip install chloris_app_sdk[orjson]), it parses bytes directly and is much faster
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
+
+# typed to fit both modules: orjson serializes to bytes and json to str, both are accepted as request bodies
+json_loads: Callable[[Union[str, bytes]], Any] = _json.loads
+json_dumps: Callable[[Any], Union[str, bytes]] = _json.dumps
+
+# woody biomass has a carbon content of 50%, but when burned that carbon
+# binds to oxygen to form CO2, so we need to multiply by 44/12 to get the
+# CO2 equivalent.
+_TCO2E_FACTOR = 0.5 * (44 / 12)
 
 
 def is_token_expired(token: str, expiration_tolerance: int = 10) -> bool:
@@ -16,20 +31,35 @@ def is_token_expired(token: str, expiration_tolerance: int = 10) -> bool:
         bool: True if the token is expired, False otherwise.
     """
     try:
-        # Decode the JWT payload.
-        payload = decode_jwt(token)
-
         # Extract the 'exp' claim from the payload (expiration timestamp in seconds).
-        exp_timestamp = payload.get("exp")
+        exp_timestamp = get_token_expiration(token)
 
         if exp_timestamp is None:
             return True
         # Check if the token will expire in the next 10 minutes.
-        return datetime.now(tz=timezone.utc) >= (datetime.fromtimestamp(exp_timestamp, tz=timezone.utc) - timedelta(minutes=expiration_tolerance))
+        return time.time() >= exp_timestamp - expiration_tolerance * 60
     except Exception as ex:
         return True
 
 
+def get_token_expiration(token: str) -> Optional[float]:
+    """Get the expiration timestamp of a JWT token without validating it.
+
+    The decoded payload is cached per token, since a token's expiration never changes.
+
+    Args:
+        token (str): The JWT token to inspect.
+
+    Returns:
+        Optional[float]: The 'exp' claim as a UNIX timestamp in seconds, or None if the token can't be decoded or has no expiration.
+    """
+    try:
+        exp_timestamp = _decode_jwt_cached(token).get("exp")
+    except Exception:
+        return None
+    return float(exp_timestamp) if exp_timestamp is not None else None
+
+
 def decode_jwt(token: str) -> Mapping[str, Any]:
     """Decode a JWT token without validating it and return the payload as a dictionary.
 
@@ -39,12 +69,24 @@ def decode_jwt(token: str) -> Mapping[str, Any]:
     Returns:
         Mapping[str, Any]: The decoded payload as a dictionary.
     """
-    # extract and decode the payload from the token
-    payload = token.split(".")[1]
-    decoded_payload = base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)).decode("utf-8")
+    # copy the cached payload, so callers can modify or serialize it
+    return dict(_decode_jwt_cached(token))
+
+
+@lru_cache(maxsize=64)
+def _decode_jwt_cached(token: str) -> Mapping[str, Any]:
+    """Decode a JWT token's payload, cached per token (in memory only, like the tokens held by the client).
+
+    The returned payload is shared between callers and must not be modified.
+    """
+    # extract the payload (between the first two dots) from the token and decode it, as bytes
+    start = token.index(".") + 1
+    end = token.find(".", start)
+    payload = token[start:end if end != -1 else None].encode("ascii")
+    decoded_payload = base64.urlsafe_b64decode(payload + b"=" * (-len(payload) % 4))
 
     # Parse the decoded payload as JSON and return it.
-    return json.loads(decoded_payload)
+    return json_loads(decoded_payload)
 
 
 def to_tco2e(x: Optional[float]) -> Optional[float]:
@@ -58,7 +100,18 @@ def to_tco2e(x: Optional[float]) -> Optional[float]:
     """
     if x is None:
         return None
-    # woody biomass has a carbon content of 50%, but when burned that carbon
-    # binds to oxygen to form CO2, so we need to multiply by 44/12 to get the
-    # CO2 equivalent.
-    return x * 0.5 * (44 / 12)
+    return x * _TCO2E_FACTOR
+
+
+def to_tco2e_array(x: Any) -> Any:
+    """Convert tons of biomass to CO2 equivalent tons for a whole array at once. Requires numpy.
+
+    Args:
+        x (array-like): Tons biomass, None values are treated as NaN
+
+    Returns:
+        numpy.ndarray: Tons CO2 equivalent
+    """
+    import numpy as np
+
+    return np.asarray(x, dtype=float) * _TCO2E_FACTOR